@@ -0,0 +1,523 @@
+import random
+import logging
+from enum import Enum
+from typing import List, Tuple, Optional
+from app.models.grid import SudokuGrid
+from app.core.solver import SudokuSolver
+from app.core.topology import SudokuTopology
+
+logger = logging.getLogger("MTSudoku")
+
+class SearchStatus(Enum):
+    PAUSED = "paused"           # Node budget used up, resume() continues the search
+    SOLVED = "solved"           # Solve search: solution written to the grid
+    UNSOLVABLE = "unsolvable"   # Solve search: no solution exists
+    COUNTED = "counted"         # Count search: limit reached or every branch explored
+    CANCELLED = "cancelled"     # cancel() was called on a paused search
+
+class BitmaskSolver(SudokuSolver):
+    """
+    Backtracking solver that keeps one occupancy bitmask per unit
+    (row, column, box/region and every extra unit of the grid's constraints).
+
+    Masks are updated incrementally on place/unplace, so a safety check is
+    an OR of the cell's unit masks instead of rescanning the board.
+    Drop-in replacement for SudokuSolver: with cell_selection="first" and
+    propagation="none", solve() and count_solutions() visit candidates in
+    the same order and return identical results.
+
+    cell_selection="mrv" instead branches on the empty cell with the fewest
+    legal candidates; cells with a single candidate are filled first
+    (naked singles) and a cell with none fails the branch immediately.
+    Solution counts are the same, the search tree is much smaller.
+
+    propagation="singles" places every naked single (one candidate left in
+    a cell) and hidden single (one place left for a digit in a unit) before
+    the search and after each branch; "locked" also removes candidates
+    with locked candidates (pointing / claiming between intersecting units).
+    Most easy puzzles are then solved without branching at all.
+
+    The search is iterative: empties[:top] are the filled cells, and one
+    preallocated stack slot per branch level holds where the level started,
+    its used mask and the next candidate to try. Everything placed above a
+    level's start (the branch digit and what propagation derived from it)
+    is undone when the level moves on. Because the whole search state lives
+    in those slots, a search can stop after a node budget and be resumed:
+
+        solver.start_count(grid, limit=2)
+        while solver.resume(max_nodes=10000) == SearchStatus.PAUSED:
+            ...  # do other work, or solver.cancel() to give up
+
+    Between start_*() and the end of the search the grid must not be modified.
+    """
+    CELL_SELECTIONS = ("first", "mrv")
+    PROPAGATIONS = ("none", "singles", "locked")
+
+    def __init__(self, cell_selection: str = "first", propagation: str = "none"):
+        super().__init__()
+        if cell_selection not in self.CELL_SELECTIONS:
+            raise ValueError(f"Unknown cell selection '{cell_selection}' (available: {', '.join(self.CELL_SELECTIONS)})")
+        if propagation not in self.PROPAGATIONS:
+            raise ValueError(f"Unknown propagation '{propagation}' (available: {', '.join(self.PROPAGATIONS)})")
+        self.cell_selection = cell_selection
+        self.propagation = propagation
+        self.status = None
+        self.nodes_visited = 0      # Branch nodes expanded by the last search
+        self.propagated_cells = 0   # Cells placed by propagation in the last search
+        self.budget_exceeded = False
+        self._size = 0
+        self._full_mask = 0
+        self._values: List[int] = []
+        self._cells = []
+        self._unit_masks: List[int] = []
+        self._cell_units: Tuple[Tuple[int, ...], ...] = ()
+        self._primary_units: List[Tuple[int, Tuple[int, ...]]] = []
+        self._intersections = ()
+        self._opaque_constraints = []
+        self._grid = None
+
+        # Search state
+        self._empties: List[int] = []
+        self._position: List[int] = []  # Position of each cell in _empties
+        self._top = 0
+        self._level = 0
+        self._limit = 0
+        self._solving = False
+        self._randomize = False
+        self._numbers: List[int] = []
+        self._base: List[int] = []      # top when each level was expanded
+        self._cursor: List[int] = []    # Next position in the candidate order, -1 = level not expanded yet
+        self._used: List[int] = []      # Used mask of the branch cell of each level
+        self._marks: List[int] = []     # Elimination trail length when each level was expanded
+        self._orders: List[List[int]] = []
+        self._eliminated: List[int] = []    # Digits removed from each cell by locked candidates
+        self._trail: List[Tuple[int, int]] = []  # (cell, previous eliminated mask) undo log
+
+    def solve(self, grid: SudokuGrid, randomize: bool = False, max_nodes: Optional[int] = None) -> bool:
+        """
+        Solves the grid in-place. Returns True if solvable.
+        If randomize is True, tries numbers in random order.
+        If the search needs more than max_nodes nodes it is abandoned:
+        returns False with budget_exceeded set and the grid unchanged.
+        """
+        self.start_solve(grid, randomize)
+        if self.resume(max_nodes) == SearchStatus.PAUSED:
+            self.cancel()
+        self._log_stats("solve")
+        return self.status == SearchStatus.SOLVED
+
+    def count_solutions(self, grid: SudokuGrid, limit: int = 2, max_nodes: Optional[int] = None) -> int:
+        """
+        Counts number of solutions. Used to check uniqueness.
+        Stops if count reaches 'limit'. The grid is left unchanged.
+        If the search needs more than max_nodes nodes it is abandoned with
+        budget_exceeded set; the count is then only a lower bound.
+        """
+        self.start_count(grid, limit)
+        if self.resume(max_nodes) == SearchStatus.PAUSED:
+            self.cancel()
+        self._log_stats("count_solutions")
+        return self.solution_count
+
+    def start_solve(self, grid: SudokuGrid, randomize: bool = False):
+        """Prepares a search for one solution; run it with resume()."""
+        self._start(grid, limit=1, solving=True, randomize=randomize)
+
+    def start_count(self, grid: SudokuGrid, limit: int = 2):
+        """Prepares a search counting up to 'limit' solutions; run it with resume()."""
+        self._start(grid, limit=limit, solving=False, randomize=False)
+
+    def _start(self, grid: SudokuGrid, limit: int, solving: bool, randomize: bool):
+        empties = self._load(grid)
+        levels = len(empties) + 1
+        size = self._size
+
+        self._empties = empties
+        self._position = [0] * (size * size)
+        for pos, idx in enumerate(empties):
+            self._position[idx] = pos
+        self._top = 0
+        self._level = 0
+        self._limit = limit
+        self._solving = solving
+        self._randomize = randomize
+        self._numbers = list(range(1, size + 1))
+        self._base = [0] * levels
+        self._cursor = [-1] * levels
+        self._used = [0] * levels
+        self._marks = [0] * levels
+        self._orders = [list(self._numbers) for _ in range(levels)] if randomize else []
+        self._eliminated = [0] * (size * size)
+        self._trail = []
+
+        self.solution_count = 0
+        self.nodes_visited = 0
+        self.propagated_cells = 0
+        self.budget_exceeded = False
+        self.status = SearchStatus.PAUSED
+        if limit <= 0:
+            self._finish()
+        elif self.propagation != "none" and not self._propagate():
+            self._finish() # The givens already contradict each other
+
+    def resume(self, max_nodes: Optional[int] = None) -> SearchStatus:
+        """
+        Continues the current search, expanding at most max_nodes more nodes
+        (None = no limit). Returns PAUSED if the budget ran out first.
+        """
+        if self.status != SearchStatus.PAUSED:
+            return self.status
+        self.budget_exceeded = False
+
+        empties = self._empties
+        count = len(empties)
+        size = self._size
+        masks = self._unit_masks
+        cell_units = self._cell_units
+        values = self._values
+        cells = self._cells
+        trail = self._trail
+        opaque = bool(self._opaque_constraints)
+        propagate = self._propagate if self.propagation != "none" else None
+        base, cursor, used_masks, marks = self._base, self._cursor, self._used, self._marks
+        randomize, orders, numbers = self._randomize, self._orders, self._numbers
+        select_cell = self._select_cell
+        can_place = self._can_place
+        budget = -1 if max_nodes is None else max_nodes
+
+        level = self._level
+        top = self._top
+        while level >= 0:
+            if cursor[level] < 0:
+                if top == count:
+                    # Filled before any branching (no empty cells, or all propagated)
+                    self.solution_count += 1
+                    break
+
+                # Expand a new level
+                if budget == 0:
+                    self._level, self._top = level, top
+                    self.budget_exceeded = True
+                    return self.status
+                budget -= 1
+                self.nodes_visited += 1
+
+                base[level] = top
+                marks[level] = len(trail)
+                used_masks[level] = select_cell(top)
+                cursor[level] = 0
+                if randomize:
+                    order = orders[level]
+                    order[:] = numbers
+                    random.shuffle(order)
+            else:
+                # Back at this level: undo the previous branch and what was derived from it
+                start = base[level]
+                while top > start:
+                    top -= 1
+                    idx = empties[top]
+                    bit = 1 << values[idx]
+                    for unit_index in cell_units[idx]:
+                        masks[unit_index] ^= bit
+                    values[idx] = 0
+                    if opaque:
+                        cells[idx].value = 0
+                if len(trail) > marks[level]:
+                    self._restore_eliminations(marks[level])
+
+            idx = empties[top]
+            used = used_masks[level]
+            order = orders[level] if randomize else numbers
+            pos = cursor[level]
+            while pos < size:
+                num = order[pos]
+                pos += 1
+                if not used & (1 << num) and (not opaque or can_place(idx, num, used)):
+                    break
+            else:
+                # No candidate left: backtrack
+                cursor[level] = -1
+                level -= 1
+                continue
+
+            cursor[level] = pos
+            bit = 1 << num
+            for unit_index in cell_units[idx]:
+                masks[unit_index] |= bit
+            values[idx] = num
+            if opaque:
+                cells[idx].value = num
+            top += 1
+
+            if propagate:
+                self._top = top
+                consistent = propagate()
+                top = self._top
+                if not consistent:
+                    continue # Contradiction: try the next candidate of this level
+
+            if top == count:
+                self.solution_count += 1
+                if self.solution_count >= self._limit:
+                    break
+                continue # Try the next candidate of this level
+            level += 1
+
+        self._level, self._top = level, top
+        self._finish()
+        return self.status
+
+    def cancel(self):
+        """Abandons a paused search and restores the grid."""
+        if self.status == SearchStatus.PAUSED:
+            self._unwind()
+            self.status = SearchStatus.CANCELLED
+
+    def _finish(self):
+        if self._solving and self.solution_count:
+            # Write the solution back (already done per move if opaque constraints are present)
+            for idx in self._empties:
+                self._cells[idx].value = self._values[idx]
+            self.status = SearchStatus.SOLVED
+            return
+
+        self._unwind()
+        self.status = SearchStatus.UNSOLVABLE if self._solving else SearchStatus.COUNTED
+
+    def _unwind(self):
+        """Undoes every placement and elimination still in effect."""
+        masks = self._unit_masks
+        for pos in range(self._top - 1, -1, -1):
+            idx = self._empties[pos]
+            bit = 1 << self._values[idx]
+            for unit_index in self._cell_units[idx]:
+                masks[unit_index] ^= bit
+            self._values[idx] = 0
+            if self._opaque_constraints:
+                self._cells[idx].value = 0
+        self._restore_eliminations(0)
+        self._top = 0
+        self._level = 0
+
+    def _log_stats(self, operation: str):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{operation}: {self.status.value}, {self.solution_count} solution(s), "
+                         f"{self.nodes_visited} branch nodes, {self.propagated_cells} propagated cells")
+
+    def _load(self, grid: SudokuGrid) -> List[int]:
+        """
+        Builds unit masks for the grid's current values.
+        Returns the flat indices of empty cells in row-major order.
+        """
+        size = grid.size
+        self._size = size
+        self._full_mask = ((1 << (size + 1)) - 1) & ~1 # bits 1..size
+        self._grid = grid
+        self._cells = [cell for row in grid.cells for cell in row]
+        self._values = [cell.value for cell in self._cells]
+
+        topology = SudokuTopology.for_grid(grid)
+        self._opaque_constraints = [grid.constraints[i] for i in topology.opaque_indices]
+        self._cell_units = topology.cell_units
+
+        masks = [0] * len(topology.units)
+        primary_units = []
+        for unit_index, unit in enumerate(topology.units):
+            clash = False
+            for idx in unit:
+                value = self._values[idx]
+                if value:
+                    clash = clash or bool(masks[unit_index] & (1 << value))
+                    masks[unit_index] |= 1 << value
+            # Only a full-size unit without clashing givens must contain every digit
+            if len(unit) == size and not clash:
+                primary_units.append((unit_index, unit))
+        self._unit_masks = masks
+        self._primary_units = primary_units
+
+        if self.propagation == "locked":
+            primary = {unit_index for unit_index, _ in primary_units}
+            self._intersections = [entry for entry in topology.intersections if entry[0] in primary]
+
+        return [idx for idx, value in enumerate(self._values) if value == 0]
+
+    def _can_place(self, idx: int, num: int, used: int) -> bool:
+        if used & (1 << num):
+            return False
+        if self._opaque_constraints:
+            row, col = divmod(idx, self._size)
+            for constraint in self._opaque_constraints:
+                if not constraint.is_valid(self._grid, row, col, num):
+                    return False
+        return True
+
+    def _used_mask(self, idx: int) -> int:
+        """Digits the cell can't take: used in one of its units or eliminated."""
+        used = self._eliminated[idx]
+        masks = self._unit_masks
+        for unit_index in self._cell_units[idx]:
+            used |= masks[unit_index]
+        return used
+
+    def _candidates(self, idx: int) -> int:
+        candidates = self._full_mask & ~self._used_mask(idx)
+        if self._opaque_constraints and candidates:
+            for num in range(1, self._size + 1):
+                if candidates & (1 << num) and not self._can_place(idx, num, 0):
+                    candidates &= ~(1 << num)
+        return candidates
+
+    def _select_cell(self, top: int) -> int:
+        """
+        Moves the next cell to branch on to empties[top] and returns its used mask.
+        empties[top:] are the cells still empty.
+        """
+        empties = self._empties
+        if self.cell_selection == "first":
+            return self._used_mask(empties[top])
+
+        # MRV: the cell whose units leave the fewest candidates
+        full = self._full_mask
+        best_pos = top
+        best_used = 0
+        best_count = self._size + 1
+        for pos in range(top, len(empties)):
+            used = self._used_mask(empties[pos])
+            count = (full & ~used).bit_count()
+            if count < best_count:
+                best_pos, best_used, best_count = pos, used, count
+                if count <= 1:
+                    break # Naked single (or dead end): no better choice exists
+
+        self._swap(top, best_pos)
+        return best_used
+
+    def _swap(self, pos_a: int, pos_b: int):
+        empties, position = self._empties, self._position
+        idx_a, idx_b = empties[pos_a], empties[pos_b]
+        empties[pos_a], empties[pos_b] = idx_b, idx_a
+        position[idx_a], position[idx_b] = pos_b, pos_a
+
+    def _assign(self, idx: int, num: int):
+        """Places a digit found by propagation."""
+        self._swap(self._top, self._position[idx])
+        self._top += 1
+
+        bit = 1 << num
+        masks = self._unit_masks
+        for unit_index in self._cell_units[idx]:
+            masks[unit_index] |= bit
+        self._values[idx] = num
+        if self._opaque_constraints:
+            self._cells[idx].value = num
+        self.propagated_cells += 1
+
+    def _restore_eliminations(self, mark: int):
+        trail, eliminated = self._trail, self._eliminated
+        while len(trail) > mark:
+            idx, previous = trail.pop()
+            eliminated[idx] = previous
+
+    def _propagate(self) -> bool:
+        """
+        Places forced digits until nothing changes.
+        Returns False if the grid turned out to be contradictory.
+        """
+        empties = self._empties
+        count = len(empties)
+        values = self._values
+        masks = self._unit_masks
+        full = self._full_mask
+        candidates = self._candidates
+
+        while self._top < count:
+            progress = False
+
+            # Naked singles: a cell with one candidate left
+            pos = self._top
+            while pos < count:
+                idx = empties[pos]
+                cell_candidates = candidates(idx)
+                if not cell_candidates:
+                    return False
+                if not cell_candidates & (cell_candidates - 1):
+                    self._assign(idx, cell_candidates.bit_length() - 1)
+                    progress = True
+                pos += 1
+            if progress:
+                continue
+
+            # Hidden singles: a digit with one place left in a unit
+            for unit_index, unit in self._primary_units:
+                missing = full & ~masks[unit_index]
+                if not missing:
+                    continue
+                once = twice = 0
+                for idx in unit:
+                    if not values[idx]:
+                        cell_candidates = candidates(idx)
+                        twice |= once & cell_candidates
+                        once |= cell_candidates
+                if missing & ~once:
+                    return False # A digit has no place left in this unit
+
+                singles = missing & once & ~twice
+                while singles:
+                    bit = singles & -singles
+                    singles ^= bit
+                    if masks[unit_index] & bit:
+                        continue
+                    # Candidates only shrank since the scan, so the digit can go nowhere else
+                    for idx in unit:
+                        if not values[idx] and candidates(idx) & bit:
+                            self._assign(idx, bit.bit_length() - 1)
+                            progress = True
+                            break
+                    else:
+                        return False
+            if progress:
+                continue
+
+            if self.propagation == "locked" and self._apply_locked_candidates():
+                continue
+            break
+
+        return True
+
+    def _apply_locked_candidates(self) -> bool:
+        """
+        If a unit's candidates for a digit all lie where it intersects another
+        unit, the digit is removed from the rest of that other unit.
+        Returns True if a candidate was removed.
+        """
+        values = self._values
+        masks = self._unit_masks
+        full = self._full_mask
+        candidates = self._candidates
+        eliminated = self._eliminated
+        changed = False
+
+        for unit_index, _, shared, only_unit, only_other in self._intersections:
+            digits = full & ~masks[unit_index]
+            if not digits:
+                continue
+            inside = 0
+            for idx in shared:
+                if not values[idx]:
+                    inside |= candidates(idx)
+            digits &= inside
+            for idx in only_unit:
+                if not digits:
+                    break
+                if not values[idx]:
+                    digits &= ~candidates(idx)
+            if not digits:
+                continue
+
+            for idx in only_other:
+                if not values[idx] and candidates(idx) & digits:
+                    self._trail.append((idx, eliminated[idx]))
+                    eliminated[idx] |= digits
+                    changed = True
+
+        return changed
@@ -0,0 +1,256 @@
+import random
+from typing import List, Tuple
+from app.models.grid import SudokuGrid
+from app.core.solver import SudokuSolver
+from app.core.bitmask_solver import BitmaskSolver
+from app.core.topology import SudokuTopology
+
+class DancingLinksSolver(SudokuSolver):
+    """
+    Exact cover solver (Knuth's Algorithm X with dancing links).
+
+    Columns are built from the grid topology:
+    - one primary column per empty cell ("cell has a value")
+    - one column per (unit, missing digit); full-size units (rows, cols,
+      boxes/regions, diagonals, windows, asterisk) are primary ("digit
+      appears exactly once"), smaller units and units whose givens already
+      clash are secondary ("at most once")
+    Rows are the (cell, digit) candidates left after the givens.
+
+    Grids with constraints that have no unit form cannot be expressed as
+    exact cover and are delegated to BitmaskSolver.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._fallback = BitmaskSolver()
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._up: List[int] = []
+        self._down: List[int] = []
+        self._column: List[int] = []
+        self._col_size: List[int] = []
+        self._node_choice: List[Tuple[int, int]] = []
+        self._partial: List[int] = []
+
+    def solve(self, grid: SudokuGrid, randomize: bool = False) -> bool:
+        """
+        Solves the grid in-place. Returns True if solvable.
+        If randomize is True, tries candidate rows in random order.
+        """
+        topology = SudokuTopology.for_grid(grid)
+        if topology.opaque_indices:
+            return self._fallback.solve(grid, randomize)
+
+        if not self._build(grid, topology):
+            return False
+        if not self._search_one(randomize):
+            return False
+
+        for node in self._partial:
+            idx, num = self._node_choice[node]
+            grid.cells[idx // grid.size][idx % grid.size].value = num
+        return True
+
+    def count_solutions(self, grid: SudokuGrid, limit: int = 2) -> int:
+        """
+        Counts number of solutions. Used to check uniqueness.
+        Stops if count reaches 'limit'. The grid is left unchanged.
+        """
+        topology = SudokuTopology.for_grid(grid)
+        if topology.opaque_indices:
+            return self._fallback.count_solutions(grid, limit)
+
+        self.solution_count = 0
+        if self._build(grid, topology):
+            self._search_count(limit)
+        return self.solution_count
+
+    def _build(self, grid: SudokuGrid, topology: SudokuTopology) -> bool:
+        """
+        Builds the dancing links matrix for the grid's current values.
+        Returns False if an empty cell has no candidate at all.
+        """
+        size = grid.size
+        values = [cell.value for row in grid.cells for cell in row]
+        units = topology.units
+
+        unit_masks = [0] * len(units)
+        clashing_units = set()
+        for unit_index, unit in enumerate(units):
+            mask = 0
+            for idx in unit:
+                if values[idx]:
+                    if mask & (1 << values[idx]):
+                        clashing_units.add(unit_index)
+                    mask |= 1 << values[idx]
+            unit_masks[unit_index] = mask
+
+        # Node 0 is the root; column headers follow, then the matrix nodes
+        left, right, up, down, column, col_size = [0], [0], [0], [0], [0], [0]
+        node_choice = [(-1, 0)]
+
+        def add_column(primary: bool) -> int:
+            c = len(left)
+            if primary:
+                # Insert before the root (end of the header list)
+                left.append(left[0])
+                right.append(0)
+                right[left[0]] = c
+                left[0] = c
+            else:
+                left.append(c)
+                right.append(c)
+            up.append(c)
+            down.append(c)
+            column.append(c)
+            col_size.append(0)
+            node_choice.append((-1, 0))
+            return c
+
+        empties = [idx for idx, value in enumerate(values) if value == 0]
+        cell_column = {idx: add_column(True) for idx in empties}
+
+        unit_digit_column = {}
+        for unit_index, unit in enumerate(units):
+            if not any(values[idx] == 0 for idx in unit):
+                continue
+            # Like the backtracking engines, clashes among givens are not rejected;
+            # such a unit can no longer hold every digit, so it only forbids repeats.
+            primary = len(unit) == size and unit_index not in clashing_units
+            for num in range(1, size + 1):
+                if not unit_masks[unit_index] & (1 << num):
+                    unit_digit_column[(unit_index, num)] = add_column(primary)
+
+        cell_units = topology.cell_units
+        for idx in empties:
+            used = 0
+            for unit_index in cell_units[idx]:
+                used |= unit_masks[unit_index]
+
+            has_candidate = False
+            for num in range(1, size + 1):
+                if used & (1 << num):
+                    continue
+                has_candidate = True
+
+                first = len(left)
+                columns = [cell_column[idx]] + [unit_digit_column[(u, num)] for u in cell_units[idx]]
+                for offset, c in enumerate(columns):
+                    node = first + offset
+                    left.append(node - 1 if offset else first + len(columns) - 1)
+                    right.append(node + 1 if offset < len(columns) - 1 else first)
+                    # Append at the bottom of column c
+                    up.append(up[c])
+                    down.append(c)
+                    down[up[c]] = node
+                    up[c] = node
+                    column.append(c)
+                    col_size[c] += 1
+                    node_choice.append((idx, num))
+
+            if not has_candidate:
+                return False
+
+        self._left, self._right, self._up, self._down = left, right, up, down
+        self._column, self._col_size, self._node_choice = column, col_size, node_choice
+        self._partial = []
+        return True
+
+    def _cover(self, c: int):
+        left, right, up, down, column, col_size = self._left, self._right, self._up, self._down, self._column, self._col_size
+        right[left[c]] = right[c]
+        left[right[c]] = left[c]
+        i = down[c]
+        while i != c:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                col_size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, c: int):
+        left, right, up, down, column, col_size = self._left, self._right, self._up, self._down, self._column, self._col_size
+        i = up[c]
+        while i != c:
+            j = left[i]
+            while j != i:
+                col_size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[c]] = c
+        left[right[c]] = c
+
+    def _choose_column(self) -> int:
+        """Returns the primary column with the fewest rows (S heuristic)."""
+        right, col_size = self._right, self._col_size
+        best = right[0]
+        best_size = col_size[best]
+        c = right[best]
+        while c != 0 and best_size > 1:
+            if col_size[c] < best_size:
+                best = c
+                best_size = col_size[c]
+            c = right[c]
+        return best
+
+    def _select_row(self, r: int):
+        j = self._right[r]
+        while j != r:
+            self._cover(self._column[j])
+            j = self._right[j]
+
+    def _deselect_row(self, r: int):
+        j = self._left[r]
+        while j != r:
+            self._uncover(self._column[j])
+            j = self._left[j]
+
+    def _search_count(self, limit: int):
+        if self._right[0] == 0:
+            self.solution_count += 1
+            return
+
+        c = self._choose_column()
+        if self._col_size[c] == 0:
+            return
+
+        self._cover(c)
+        r = self._down[c]
+        while r != c and self.solution_count < limit:
+            self._select_row(r)
+            self._search_count(limit)
+            self._deselect_row(r)
+            r = self._down[r]
+        self._uncover(c)
+
+    def _search_one(self, randomize: bool) -> bool:
+        if self._right[0] == 0:
+            return True # Solved!
+
+        c = self._choose_column()
+        if self._col_size[c] == 0:
+            return False
+
+        rows = []
+        r = self._down[c]
+        while r != c:
+            rows.append(r)
+            r = self._down[r]
+        if randomize:
+            random.shuffle(rows)
+
+        self._cover(c)
+        for r in rows:
+            self._partial.append(r)
+            self._select_row(r)
+            if self._search_one(randomize):
+                return True
+            self._deselect_row(r)
+            self._partial.pop()
+        self._uncover(c)
+        return False
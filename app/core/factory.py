@@ -1,24 +1,25 @@
 import random
-from app.models.grid import SudokuGrid
+from app.models.grid import CompactGrid
 from app.models.settings import GenerationConfig, SudokuType
-from app.core.solver import SudokuSolver
+from app.core.solver_registry import create_solver
 from app.core.logger import AppLogger
 
 class PuzzleGenerator:
     """Generates Sudoku puzzles."""
     
-    def __init__(self):
-        self.solver = SudokuSolver()
+    def __init__(self, solver_backend: str = None):
+        # Backend name from SOLVER_BACKENDS; None uses the configured one (settings.json)
+        self.solver = create_solver(solver_backend)
         self.logger = AppLogger.get_logger()
 
-    def generate(self, config: GenerationConfig) -> SudokuGrid:
+    def generate(self, config: GenerationConfig) -> CompactGrid:
         """
         Main entry point to generate a puzzle based on config.
         """
         # self.logger.debug(f"Generating puzzle: {config.type.value}, Size {config.size}") # Verbose
 
         # 1. Create Empty Grid
-        grid = SudokuGrid(size=config.size)
+        grid = CompactGrid(size=config.size)
         grid.type_name = config.type.value
         
         # 2. Apply Constraints based on Type
@@ -90,7 +91,7 @@ class PuzzleGenerator:
                 self.logger.warning(f"First solve attempt failed. Retrying up to {max_retries} times...")
                 for attempt in range(max_retries):
                     # Reset Grid
-                    grid = SudokuGrid(size=config.size)
+                    grid = CompactGrid(size=config.size)
                     grid.type_name = config.type.value
                     
                     # Re-apply constraints
@@ -131,7 +132,7 @@ class PuzzleGenerator:
         
         return grid
 
-    def _apply_logic_variants(self, grid: SudokuGrid, config: GenerationConfig):
+    def _apply_logic_variants(self, grid: CompactGrid, config: GenerationConfig):
         """
         Derives constraints from the solved grid for logic variants.
         """
@@ -152,14 +153,15 @@ class PuzzleGenerator:
                             grid.consecutive_pairs.append(((r, c), (r+1, c)))
                             
         if "even" in config.type.value.lower() and "odd" in config.type.value.lower():
-            # Mark Even cells
-            grid.even_odd_mask = [[False for _ in range(grid.size)] for _ in range(grid.size)]
+            # Mark Even cells (assigned as a whole: CompactGrid stores the mask as a bitset)
+            even_odd_mask = [[False for _ in range(grid.size)] for _ in range(grid.size)]
             for r in range(grid.size):
                 for c in range(grid.size):
                     if grid.cells[r][c].value % 2 == 0:
-                        grid.even_odd_mask[r][c] = True
+                        even_odd_mask[r][c] = True
+            grid.even_odd_mask = even_odd_mask
 
-    def _remove_digits(self, grid: SudokuGrid, config: GenerationConfig):
+    def _remove_digits(self, grid: CompactGrid, config: GenerationConfig):
         """
         Removes digits to reach the target difficulty while ensuring uniqueness.
         """
@@ -1,5 +1,6 @@
 from typing import List, Tuple, Optional
 from app.models.grid import SudokuGrid, SudokuCell
+from app.core.topology import SudokuTopology, get_box_dimensions
 
 class SudokuSolver:
     """Core solver logic using Backtracking."""
@@ -10,47 +11,21 @@ class SudokuSolver:
     def is_safe(self, grid: SudokuGrid, row: int, col: int, num: int) -> bool:
         """
         Checks if it's safe to place 'num' at grid[row][col].
-        Validates against Row, Column, and Box.
+        Validates against Row, Column, Box/Region and every constraint unit.
         """
-        
-        # 1. Check Row
-        if num in grid.get_row(row):
-            return False
-            
-        # 2. Check Column
-        if num in grid.get_col(col):
-            return False
-
-        # 3. Check Box / Region
-        if "jigsaw" in grid.type_name.lower():
-            # Check Jigsaw Region
-            target_region = grid.cells[row][col].region_id
-            # Optimization: We could pre-cache region cells, but for now we iterate or use helper
-            # Using get_region_cells is slow (O(N^2)). 
-            # Better: Iterate grid and check only matching region_id.
-            # Even better: The grid should ideally maintain a map of region_id -> list of cells.
-            # For now, let's iterate, but we can optimize later.
-            for r in range(grid.size):
-                for c in range(grid.size):
-                    if grid.cells[r][c].region_id == target_region:
-                        if grid.cells[r][c].value == num:
-                            return False
-        else:
-            # Standard Box Check
-            # Determine box dimensions based on grid size
-            box_rows, box_cols = self._get_box_dimensions(grid.size)
-
-            start_row = row - row % box_rows
-            start_col = col - col % box_cols
-            
-            for i in range(box_rows):
-                for j in range(box_cols):
-                    if grid.cells[start_row + i][start_col + j].value == num:
-                        return False
-        
-        # 4. Check Custom Constraints (Strategy Pattern)
-        if not grid.is_valid_move(row, col, num):
-            return False
+        return self._is_safe(grid, SudokuTopology.for_grid(grid), row, col, num)
+
+    def _is_safe(self, grid: SudokuGrid, topology: SudokuTopology, row: int, col: int, num: int) -> bool:
+        # 1. Check every peer (row, column, box/region and constraint units)
+        cells = grid.cells
+        for r, c in topology.peer_cells[row * grid.size + col]:
+            if cells[r][c].value == num:
+                return False
+
+        # 2. Check Custom Constraints that have no unit form (Strategy Pattern)
+        for i in topology.opaque_indices:
+            if not grid.constraints[i].is_valid(grid, row, col, num):
+                return False
 
         return True
 
@@ -59,6 +34,9 @@ class SudokuSolver:
         Solves the grid in-place. Returns True if solvable.
         If randomize is True, tries numbers in random order.
         """
+        return self._solve_helper(grid, SudokuTopology.for_grid(grid), randomize)
+
+    def _solve_helper(self, grid: SudokuGrid, topology: SudokuTopology, randomize: bool) -> bool:
         empty_cell = self._find_empty_location(grid)
         if not empty_cell:
             return True # Solved!
@@ -71,10 +49,10 @@ class SudokuSolver:
             random.shuffle(numbers)
 
         for num in numbers:
-            if self.is_safe(grid, row, col, num):
+            if self._is_safe(grid, topology, row, col, num):
                 grid.cells[row][col].value = num
 
-                if self.solve(grid, randomize):
+                if self._solve_helper(grid, topology, randomize):
                     return True
 
                 # Backtrack
@@ -88,10 +66,10 @@ class SudokuSolver:
         Stops if count reaches 'limit' (optimization).
         """
         self.solution_count = 0
-        self._count_helper(grid, limit)
+        self._count_helper(grid, SudokuTopology.for_grid(grid), limit)
         return self.solution_count
 
-    def _count_helper(self, grid: SudokuGrid, limit: int):
+    def _count_helper(self, grid: SudokuGrid, topology: SudokuTopology, limit: int):
         if self.solution_count >= limit:
             return
 
@@ -102,9 +80,9 @@ class SudokuSolver:
 
         row, col = empty_cell
         for num in range(1, grid.size + 1):
-            if self.is_safe(grid, row, col, num):
+            if self._is_safe(grid, topology, row, col, num):
                 grid.cells[row][col].value = num
-                self._count_helper(grid, limit)
+                self._count_helper(grid, topology, limit)
                 grid.cells[row][col].value = 0 # Backtrack
 
     def _find_empty_location(self, grid: SudokuGrid) -> Optional[Tuple[int, int]]:
@@ -117,19 +95,4 @@ class SudokuSolver:
 
     def _get_box_dimensions(self, size: int) -> Tuple[int, int]:
         """Returns (rows, cols) for the sub-grid box based on total size."""
-        if size == 6: return (2, 3)
-        if size == 8: return (2, 4)
-        if size == 9: return (3, 3)
-        if size == 10: return (2, 5)
-        if size == 12: return (3, 4)
-        if size == 14: return (2, 7)
-        if size == 15: return (3, 5)
-        if size == 16: return (4, 4)
-        
-        # Fallback for perfect squares
-        root = int(size ** 0.5)
-        if root * root == size:
-            return (root, root)
-            
-        # Default fallback (might not be correct for primes, but safe enough to prevent crash)
-        return (1, size)
+        return get_box_dimensions(size)
@@ -0,0 +1,43 @@
+from typing import Optional
+from app.core.solver import SudokuSolver
+from app.core.bitmask_solver import BitmaskSolver
+from app.core.dlx_solver import DancingLinksSolver
+
+# Available solver backends, selectable via "solver_settings" in settings.json
+SOLVER_BACKENDS = {
+    "backtracking": SudokuSolver,
+    "bitmask": BitmaskSolver,
+    "dlx": DancingLinksSolver,
+}
+
+DEFAULT_BACKEND = "bitmask"
+
+DEFAULT_CELL_SELECTION = "mrv"
+
+DEFAULT_PROPAGATION = "singles"
+
+def create_solver(backend: Optional[str] = None, cell_selection: Optional[str] = None,
+                  propagation: Optional[str] = None) -> SudokuSolver:
+    """
+    Creates a solver for the given backend name.
+    Arguments left as None are read from "solver_settings" (settings.json).
+    cell_selection ("first" / "mrv") and propagation ("none" / "singles" / "locked")
+    only apply to the bitmask backend.
+    """
+    if backend is None or cell_selection is None or propagation is None:
+        from app.services.config_manager import ConfigManager
+        config_manager = ConfigManager()
+        if backend is None:
+            backend = config_manager.get_solver_setting("backend", DEFAULT_BACKEND)
+        if cell_selection is None:
+            cell_selection = config_manager.get_solver_setting("cell_selection", DEFAULT_CELL_SELECTION)
+        if propagation is None:
+            propagation = config_manager.get_solver_setting("propagation", DEFAULT_PROPAGATION)
+
+    if backend not in SOLVER_BACKENDS:
+        raise ValueError(f"Unknown solver backend '{backend}' (available: {', '.join(SOLVER_BACKENDS)})")
+
+    solver_class = SOLVER_BACKENDS[backend]
+    if issubclass(solver_class, BitmaskSolver):
+        return solver_class(cell_selection=cell_selection, propagation=propagation)
+    return solver_class()
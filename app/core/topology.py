@@ -0,0 +1,179 @@
+"""
+Puzzle Topology
+Precomputed unit/peer layout for a (type, size, region map) combination
+"""
+from collections import OrderedDict
+from typing import List, Tuple, Optional, Sequence
+
+def get_box_dimensions(size: int) -> Tuple[int, int]:
+    """Returns (rows, cols) for the sub-grid box based on total size."""
+    if size == 6: return (2, 3)
+    if size == 8: return (2, 4)
+    if size == 9: return (3, 3)
+    if size == 10: return (2, 5)
+    if size == 12: return (3, 4)
+    if size == 14: return (2, 7)
+    if size == 15: return (3, 5)
+    if size == 16: return (4, 4)
+
+    # Fallback for perfect squares
+    root = int(size ** 0.5)
+    if root * root == size:
+        return (root, root)
+
+    # Default fallback (might not be correct for primes, but safe enough to prevent crash)
+    return (1, size)
+
+class SudokuTopology:
+    """
+    Immutable description of which cells share a unit.
+    Cells are addressed by flat index (row * size + col).
+
+    - units / unit_kinds: every "all different" unit and its kind
+      ('row', 'col', 'box', 'region', or the constraint's unit_kind)
+    - cell_units: unit indices containing each cell
+    - peers: every other cell sharing at least one unit with each cell
+    - opaque_indices: positions of constraints that have no unit form
+      and must still be checked through ConstraintStrategy.is_valid()
+
+    Instances are cached, so build them through for_grid() or build().
+    """
+    _MAX_CACHED = 1024
+    _cache: "OrderedDict[tuple, SudokuTopology]" = OrderedDict()
+
+    def __init__(self, size: int, units: List[Tuple[int, ...]], unit_kinds: List[str], opaque_indices: Tuple[int, ...] = ()):
+        self.size = size
+        self.units = tuple(units)
+        self.unit_kinds = tuple(unit_kinds)
+        self.opaque_indices = tuple(opaque_indices)
+
+        cell_units = [[] for _ in range(size * size)]
+        for unit_index, unit in enumerate(self.units):
+            for idx in unit:
+                cell_units[idx].append(unit_index)
+        self.cell_units = tuple(tuple(u) for u in cell_units)
+
+        peers = []
+        for idx in range(size * size):
+            cell_peers = set()
+            for unit_index in self.cell_units[idx]:
+                cell_peers.update(self.units[unit_index])
+            cell_peers.discard(idx)
+            peers.append(tuple(sorted(cell_peers)))
+        self.peers = tuple(peers)
+
+        # (row, col) form of the peers for code that walks grid.cells directly
+        self.peer_cells = tuple(tuple(divmod(p, size) for p in cell_peers) for cell_peers in self.peers)
+        self._intersections = None
+
+    @property
+    def intersections(self) -> Tuple[Tuple[int, int, Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]], ...]:
+        """
+        (unit, other_unit, shared cells, cells only in unit, cells only in other_unit)
+        for every ordered pair of units sharing at least two cells (box/line, etc.).
+        Built on first use.
+        """
+        if self._intersections is None:
+            unit_sets = [set(unit) for unit in self.units]
+            pairs = []
+            for a, unit_a in enumerate(self.units):
+                for b, unit_b in enumerate(self.units):
+                    if a == b:
+                        continue
+                    shared = unit_sets[a] & unit_sets[b]
+                    if len(shared) < 2:
+                        continue
+                    pairs.append((
+                        a, b,
+                        tuple(idx for idx in unit_a if idx in shared),
+                        tuple(idx for idx in unit_a if idx not in shared),
+                        tuple(idx for idx in unit_b if idx not in shared),
+                    ))
+            self._intersections = tuple(pairs)
+        return self._intersections
+
+    def units_of_kind(self, kind: str) -> List[Tuple[int, ...]]:
+        return [unit for unit, unit_kind in zip(self.units, self.unit_kinds) if unit_kind == kind]
+
+    def cells_of_kind(self, kind: str) -> List[Tuple[int, int]]:
+        """Returns the distinct (row, col) cells covered by units of the given kind."""
+        cells = sorted({idx for unit in self.units_of_kind(kind) for idx in unit})
+        return [divmod(idx, self.size) for idx in cells]
+
+    @classmethod
+    def for_grid(cls, grid) -> "SudokuTopology":
+        """Returns the topology for a grid (jigsaw regions are read from the cells)."""
+        region_key = None
+        if "jigsaw" in grid.type_name.lower():
+            # CompactGrid keeps its regions as a flat bytes map already
+            region_key = getattr(grid, "region_map", None)
+            if region_key is None:
+                region_key = [cell.region_id for row in grid.cells for cell in row]
+            region_key = tuple(region_key)
+        return cls._get(grid.size, region_key, grid.constraints)
+
+    @classmethod
+    def build(cls, size: int, region_map: Optional[List[List[int]]] = None, constraints: Sequence = ()) -> "SudokuTopology":
+        """
+        Returns the cached topology for the given layout.
+        region_map replaces the standard boxes (Jigsaw); constraints add their extra units.
+        """
+        region_key = tuple(v for row in region_map for v in row) if region_map is not None else None
+        return cls._get(size, region_key, constraints)
+
+    @classmethod
+    def _get(cls, size: int, region_key: Optional[tuple], constraints: Sequence) -> "SudokuTopology":
+        # Constraint geometry is fixed per class, so classes identify the extra units
+        key = (size, region_key, tuple(type(c) for c in constraints))
+
+        topology = cls._cache.get(key)
+        if topology is not None:
+            cls._cache.move_to_end(key)
+            return topology
+
+        topology = cls._create(size, region_key, constraints)
+        cls._cache[key] = topology
+        if len(cls._cache) > cls._MAX_CACHED:
+            cls._cache.popitem(last=False)
+        return topology
+
+    @classmethod
+    def _create(cls, size: int, region_key: Optional[tuple], constraints: Sequence) -> "SudokuTopology":
+        units = [tuple(r * size + c for c in range(size)) for r in range(size)]
+        kinds = ['row'] * size
+        units += [tuple(r * size + c for r in range(size)) for c in range(size)]
+        kinds += ['col'] * size
+
+        if region_key is not None:
+            regions = {}
+            for idx, region_id in enumerate(region_key):
+                regions.setdefault(region_id, []).append(idx)
+            units += [tuple(cells) for _, cells in sorted(regions.items())]
+            kinds += ['region'] * len(regions)
+        else:
+            box_rows, box_cols = get_box_dimensions(size)
+            for start_row in range(0, size, box_rows):
+                for start_col in range(0, size, box_cols):
+                    units.append(tuple(
+                        (start_row + i) * size + start_col + j
+                        for i in range(box_rows) for j in range(box_cols)
+                        if start_row + i < size and start_col + j < size
+                    ))
+                    kinds.append('box')
+
+        opaque = []
+        for position, constraint in enumerate(constraints):
+            extra_units = constraint.get_units(size)
+            if extra_units is None:
+                opaque.append(position)
+                continue
+            for unit in extra_units:
+                units.append(tuple(r * size + c for r, c in unit))
+                kinds.append(constraint.unit_kind)
+
+        return cls(size, units, kinds, tuple(opaque))
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear cached topologies (for testing)"""
+        cls._cache.clear()
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Optional
 
 class ConstraintStrategy(ABC):
     """
     Abstract base class for Sudoku constraints.
     """
+    # Kind reported for the extra units of this constraint (see get_units)
+    unit_kind = "extra"
+
     @abstractmethod
     def is_valid(self, grid, row: int, col: int, num: int) -> bool:
         """
@@ -12,11 +15,20 @@ class ConstraintStrategy(ABC):
         """
         pass
 
+    def get_units(self, size: int) -> Optional[List[List[Tuple[int, int]]]]:
+        """
+        Returns the extra "all different" units this constraint adds, as lists of (row, col).
+        Returns None if the constraint cannot be expressed as units (checked via is_valid instead).
+        """
+        return None
+
 class DiagonalConstraint(ConstraintStrategy):
     """
     Constraint for Diagonal Sudoku (X-Sudoku).
     Numbers must be unique on both main diagonals.
     """
+    unit_kind = "diagonal"
+
     def is_valid(self, grid, row: int, col: int, num: int) -> bool:
         size = grid.size
         
@@ -34,12 +46,20 @@ class DiagonalConstraint(ConstraintStrategy):
                     
         return True
 
+    def get_units(self, size: int) -> List[List[Tuple[int, int]]]:
+        return [
+            [(i, i) for i in range(size)],
+            [(i, size - 1 - i) for i in range(size)]
+        ]
+
 class WindokuConstraint(ConstraintStrategy):
     """
     Constraint for Windoku (Hyper Sudoku).
     Numbers must be unique in 4 extra 3x3 windows.
     Windows are usually at (1,1), (1,5), (5,1), (5,5) (top-left corners).
     """
+    unit_kind = "window"
+
     def __init__(self):
         # Define the top-left corners of the 4 windows
         self.windows = [
@@ -58,11 +78,21 @@ class WindokuConstraint(ConstraintStrategy):
                             return False
         return True
 
+    def get_units(self, size: int) -> List[List[Tuple[int, int]]]:
+        # Windows only exist where they fit inside the grid (9x9)
+        return [
+            [(r, c) for r in range(start_row, start_row + 3) for c in range(start_col, start_col + 3)]
+            for start_row, start_col in self.windows
+            if start_row + 3 <= size and start_col + 3 <= size
+        ]
+
 class AsteriskConstraint(ConstraintStrategy):
     """
     Constraint for Asterisk Sudoku.
     Numbers must be unique in the 9 asterisk cells.
     """
+    unit_kind = "asterisk"
+
     def __init__(self):
         # Define the 9 cells of the asterisk
         self.asterisk_cells = {
@@ -82,3 +112,9 @@ class AsteriskConstraint(ConstraintStrategy):
                 if grid.cells[r][c].value == num:
                     return False
         return True
+
+    def get_units(self, size: int) -> List[List[Tuple[int, int]]]:
+        # Asterisk constraint is only defined for 9x9 grids
+        if size != 9:
+            return []
+        return [sorted(self.asterisk_cells)]
@@ -90,3 +90,198 @@ class SudokuGrid:
             row_str = " ".join(str(c.value) if c.value != 0 else "." for c in self.cells[r])
             res += row_str + "\n"
         return res
+
+class CellView:
+    """
+    SudokuCell-compatible view of one cell of a CompactGrid.
+    Reads and writes go straight to the grid's arrays.
+    """
+    __slots__ = ("_grid", "_index", "row", "col")
+
+    def __init__(self, grid: "CompactGrid", row: int, col: int):
+        self._grid = grid
+        self._index = row * grid.size + col
+        self.row = row
+        self.col = col
+
+    @property
+    def value(self) -> int:
+        return self._grid.values[self._index]
+
+    @value.setter
+    def value(self, value: int):
+        self._grid.values[self._index] = value
+
+    @property
+    def is_fixed(self) -> bool:
+        return bool(self._grid.fixed >> self._index & 1)
+
+    @is_fixed.setter
+    def is_fixed(self, is_fixed: bool):
+        if is_fixed:
+            self._grid.fixed |= 1 << self._index
+        else:
+            self._grid.fixed &= ~(1 << self._index)
+
+    @property
+    def region_id(self) -> int:
+        return self._grid.region_map[self._index]
+
+    @region_id.setter
+    def region_id(self, region_id: int):
+        region_map = bytearray(self._grid.region_map)
+        region_map[self._index] = region_id
+        self._grid.region_map = bytes(region_map)
+
+    @property
+    def candidates(self) -> List[int]:
+        return [] # Not stored: the solvers keep their own candidate masks
+
+    def __repr__(self):
+        return f"Cell({self.row}, {self.col}, val={self.value})"
+
+class CompactGrid:
+    """
+    Array-backed alternative to SudokuGrid with the same interface.
+
+    - values: flat bytearray (row-major, 0 = empty)
+    - region_map: flat immutable bytes, shared between clones
+    - fixed: int bitset, bit (row * size + col) set for clues
+    - solution / even_odd_mask: stored flat, returned as new nested lists
+
+    grid.cells gives SudokuCell-compatible views (built on first use, not
+    pickled or cloned), so solvers and rendering code work unchanged.
+    A 9x9 clone copies one bytearray instead of ~160 objects.
+    """
+    __slots__ = ("size", "values", "region_map", "fixed", "constraints", "type_name",
+                 "consecutive_pairs", "_solution", "_even_mask", "_cells")
+
+    _EMPTY_REGION_MAPS = {}
+
+    def __init__(self, size: int = 9, type_name: str = "standard_9x9"):
+        self.size = size
+        self.values = bytearray(size * size)
+        self.region_map = self._EMPTY_REGION_MAPS.setdefault(size, bytes(size * size))
+        self.fixed = 0
+        self.constraints: List[ConstraintStrategy] = []
+        self.type_name = type_name
+        self.consecutive_pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+        self._solution: Optional[bytes] = None
+        self._even_mask = 0
+        self._cells = None
+
+    @classmethod
+    def from_grid(cls, grid: SudokuGrid) -> "CompactGrid":
+        compact = cls(grid.size, grid.type_name)
+        cells = [cell for row in grid.cells for cell in row]
+        compact.values = bytearray(cell.value for cell in cells)
+        if any(cell.region_id for cell in cells):
+            compact.region_map = bytes(cell.region_id for cell in cells)
+        compact.fixed = sum(1 << idx for idx, cell in enumerate(cells) if cell.is_fixed)
+        compact.constraints = list(grid.constraints)
+        compact.solution = grid.solution
+        compact.consecutive_pairs = list(grid.consecutive_pairs)
+        compact.even_odd_mask = grid.even_odd_mask
+        return compact
+
+    def to_grid(self) -> SudokuGrid:
+        grid = SudokuGrid(size=self.size)
+        grid.type_name = self.type_name
+        for row in grid.cells:
+            for cell in row:
+                idx = cell.row * self.size + cell.col
+                cell.value = self.values[idx]
+                cell.region_id = self.region_map[idx]
+                cell.is_fixed = bool(self.fixed >> idx & 1)
+        grid.constraints = list(self.constraints)
+        grid.solution = self.solution
+        grid.consecutive_pairs = list(self.consecutive_pairs)
+        grid.even_odd_mask = self.even_odd_mask
+        return grid
+
+    @property
+    def cells(self) -> List[List[CellView]]:
+        if self._cells is None:
+            self._cells = [[CellView(self, r, c) for c in range(self.size)] for r in range(self.size)]
+        return self._cells
+
+    @property
+    def solution(self) -> Optional[List[List[int]]]:
+        if self._solution is None:
+            return None
+        size = self.size
+        return [list(self._solution[r * size:(r + 1) * size]) for r in range(size)]
+
+    @solution.setter
+    def solution(self, solution: Optional[List[List[int]]]):
+        self._solution = bytes(v for row in solution for v in row) if solution else None
+
+    @property
+    def even_odd_mask(self) -> List[List[bool]]:
+        if not self._even_mask:
+            return []
+        size = self.size
+        return [[bool(self._even_mask >> (r * size + c) & 1) for c in range(size)] for r in range(size)]
+
+    @even_odd_mask.setter
+    def even_odd_mask(self, mask: List[List[bool]]):
+        self._even_mask = sum(1 << (r * self.size + c) for r, row in enumerate(mask) for c, even in enumerate(row) if even)
+
+    def is_valid_move(self, row: int, col: int, num: int) -> bool:
+        """Checks if placing num at (row, col) is valid against all constraints."""
+        for constraint in self.constraints:
+            if not constraint.is_valid(self, row, col, num):
+                return False
+        return True
+
+    def get_row(self, r: int) -> List[int]:
+        return list(self.values[r * self.size:(r + 1) * self.size])
+
+    def get_col(self, c: int) -> List[int]:
+        return list(self.values[c::self.size])
+
+    def get_region_cells(self, region_id: int) -> List[CellView]:
+        """Returns all cells belonging to a specific region ID."""
+        cells = self.cells
+        return [cells[idx // self.size][idx % self.size]
+                for idx, cell_region in enumerate(self.region_map) if cell_region == region_id]
+
+    def clone(self) -> "CompactGrid":
+        """Copies the values; the region map and solution are immutable and shared."""
+        clone = CompactGrid.__new__(CompactGrid)
+        clone.size = self.size
+        clone.values = bytearray(self.values)
+        clone.region_map = self.region_map
+        clone.fixed = self.fixed
+        clone.constraints = list(self.constraints)
+        clone.type_name = self.type_name
+        clone.consecutive_pairs = list(self.consecutive_pairs)
+        clone._solution = self._solution
+        clone._even_mask = self._even_mask
+        clone._cells = None
+        return clone
+
+    def is_full(self) -> bool:
+        """Checks if the grid is completely filled."""
+        return 0 not in self.values
+
+    def apply_region_map(self, region_map: List[List[int]]):
+        """Applies a Jigsaw region map to the grid."""
+        if len(region_map) != self.size or len(region_map[0]) != self.size:
+            raise ValueError("Region map size does not match grid size")
+        self.region_map = bytes(v for row in region_map for v in row)
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__ if slot != "_cells"}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._cells = None
+
+    def __str__(self):
+        """Simple string representation for debugging."""
+        res = ""
+        for r in range(self.size):
+            res += " ".join(str(v) if v != 0 else "." for v in self.get_row(r)) + "\n"
+        return res
@@ -59,6 +59,10 @@ class ConfigManager:
         """Returns a visual setting value (e.g. gray_color, gray_margin)."""
         return self._settings.get("visual_settings", {}).get(key, default)
 
+    def get_solver_setting(self, key: str, default=None):
+        """Returns a solver setting value (e.g. backend)."""
+        return self._settings.get("solver_settings", {}).get(key, default)
+
     def get_font_path(self, font_key: str = "thai_font") -> str:
         """
         Gets the full path to the configured font.
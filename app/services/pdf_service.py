@@ -6,6 +6,7 @@ from reportlab.pdfbase.ttfonts import TTFont
 from typing import List
 import os
 from app.models.grid import SudokuGrid
+from app.core.topology import SudokuTopology
 
 class PDFService:
     """
@@ -284,47 +285,26 @@ class PDFService:
             
             c.setStrokeColor(colors.black)  # Reset color
 
-        # Windoku Shading (9x9 only)
-        if "windoku" in grid.type_name.lower() and grid_size_cells == 9:
+        # Windoku / Asterisk Shading (cells of the extra units, from the cached topology)
+        topology = SudokuTopology.for_grid(grid)
+        shaded_cells = topology.cells_of_kind("window") + topology.cells_of_kind("asterisk")
+        if shaded_cells:
             c.setFillColor(colors.HexColor(self.gray_color))
-            # 4 Windows: R2-4 C2-4, R2-4 C6-8, R6-8 C2-4, R6-8 C6-8 (1-based)
-            # 0-based: R1-3 C1-3, R1-3 C5-7, R5-7 C1-3, R5-7 C5-7
-            windows = [
-                (1, 1), (1, 5),
-                (5, 1), (5, 5)
-            ]
             margin = self.gray_margin
-            for start_r, start_c in windows:
-                for r in range(start_r, start_r + 3):
-                    for col in range(start_c, start_c + 3):
-                        rect_y = y + (grid_size_cells - 1 - r) * cell_size
-                        c.rect(x + col * cell_size + margin, rect_y + margin, cell_size - 2*margin, cell_size - 2*margin, fill=1, stroke=0)
-            c.setFillColor(colors.black) # Reset
-
-        # Asterisk Shading (9x9 only)
-        if "asterisk" in grid.type_name.lower() and grid_size_cells == 9:
-            c.setFillColor(colors.HexColor(self.gray_color))
-            asterisk_cells = [
-                (1, 4), (2, 2), (2, 6),
-                (4, 1), (4, 4), (4, 7),
-                (6, 2), (6, 6), (7, 4)
-            ]
-            margin = self.gray_margin
-            for r, col in asterisk_cells:
-                # Draw gray rect
-                # y is inverted in my logic above? No, y grows up.
-                # Row r corresponds to y + (size - 1 - r) * cell_size
+            for r, col in shaded_cells:
+                # Row r corresponds to y + (size - 1 - r) * cell_size (y grows up)
                 rect_y = y + (grid_size_cells - 1 - r) * cell_size
                 c.rect(x + col * cell_size + margin, rect_y + margin, cell_size - 2*margin, cell_size - 2*margin, fill=1, stroke=0)
             c.setFillColor(colors.black) # Reset
 
         # Even-Odd Shading
-        if grid.even_odd_mask:
+        even_odd_mask = grid.even_odd_mask
+        if even_odd_mask:
             c.setFillColor(colors.HexColor(self.gray_color))
             margin = self.gray_margin
             for r in range(grid_size_cells):
                 for col in range(grid_size_cells):
-                    if grid.even_odd_mask[r][col]:
+                    if even_odd_mask[r][col]:
                         # Draw gray rect
                         rect_y = y + (grid_size_cells - 1 - r) * cell_size
                         c.rect(x + col * cell_size + margin, rect_y + margin, cell_size - 2*margin, cell_size - 2*margin, fill=1, stroke=0)
@@ -359,7 +339,8 @@ class PDFService:
         font_name = self.thai_font if hasattr(self, 'thai_font') and self.thai_font else "Helvetica"
         c.setFont(font_name, 24)
         
-        data_source = grid.solution if is_solution and grid.solution else [[c.value for c in row] for row in grid.cells]
+        solution = grid.solution if is_solution else None
+        data_source = solution if solution else [grid.get_row(r) for r in range(grid.size)]
 
         for r in range(grid.size):
             for col in range(grid.size):
@@ -0,0 +1,74 @@
+"""
+Solver Benchmark
+Compares the solver backends (legacy backtracking, bitmask with MRV / propagation variants, dancing links) on every SudokuType.
+Usage: python tests/benchmark_solver.py [difficulty] [repeats]
+"""
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.settings import GenerationConfig, SudokuType, Difficulty
+from app.core.factory import PuzzleGenerator
+from app.core.solver_registry import create_solver
+
+# (label, backend, cell_selection, propagation)
+BACKENDS = [
+    ("backtracking", "backtracking", "first", "none"),
+    ("bitmask", "bitmask", "first", "none"),
+    ("bitmask+mrv", "bitmask", "mrv", "none"),
+    ("mrv+singles", "bitmask", "mrv", "singles"),
+    ("mrv+locked", "bitmask", "mrv", "locked"),
+    ("dlx", "dlx", "first", "none"),
+]
+
+def time_count(solver, grid, repeats):
+    # All solvers leave the grid in its original state, so the same grid can be reused
+    start = time.perf_counter()
+    for _ in range(repeats):
+        count = solver.count_solutions(grid)
+    return (time.perf_counter() - start) / repeats, count
+
+def benchmark_solvers(difficulty: Difficulty = Difficulty.HARD, repeats: int = 3) -> bool:
+    width = 30 + 14 * len(BACKENDS) + 10
+    print("=" * width)
+    print(f"SOLVER BENCHMARK (count_solutions, {difficulty.name}, {repeats} repeats)")
+    print("=" * width)
+    header = "".join(f" | {label:>11}" for label, *_ in BACKENDS)
+    print(f"{'Type':<28}{header} | Result")
+    print("-" * width)
+
+    generator = PuzzleGenerator()
+    solvers = [create_solver(backend, cell_selection, propagation) for _, backend, cell_selection, propagation in BACKENDS]
+    totals = [0.0] * len(BACKENDS)
+    all_match = True
+
+    for sudoku_type in SudokuType:
+        grid = generator.generate(GenerationConfig(type=sudoku_type, difficulty=difficulty))
+
+        timings = [time_count(solver, grid, repeats) for solver in solvers]
+        counts = {count for _, count in timings}
+        match = len(counts) == 1
+        all_match = all_match and match
+
+        row = ""
+        for i, (elapsed, _) in enumerate(timings):
+            totals[i] += elapsed
+            row += f" | {elapsed * 1000:>9.2f}ms"
+        print(f"{sudoku_type.name:<28}{row} | {'OK' if match else 'MISMATCH'} ({timings[0][1]})")
+
+    print("-" * width)
+    row = "".join(f" | {total * 1000:>9.2f}ms" for total in totals)
+    print(f"{'TOTAL':<28}{row}")
+    speedups = ", ".join(f"{label} {totals[0] / total:.1f}x" for (label, *_), total in zip(BACKENDS[1:], totals[1:]) if total > 0)
+    print(f"Speedup vs {BACKENDS[0][0]}: {speedups}")
+    print("✅ All results identical" if all_match else "❌ Solver results differ!")
+    return all_match
+
+if __name__ == "__main__":
+    level = Difficulty[sys.argv[1].upper()] if len(sys.argv) > 1 else Difficulty.HARD
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    success = benchmark_solvers(level, repeats)
+    sys.exit(0 if success else 1)
@@ -6,6 +6,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.models.grid import SudokuGrid
 from app.models.settings import SudokuType, GenerationConfig, Difficulty
+from app.models.constraints import DiagonalConstraint, WindokuConstraint, AsteriskConstraint
+from app.core.topology import SudokuTopology
 
 class SudokuValidator:
     """
@@ -26,29 +28,13 @@ class SudokuValidator:
         solved_grid = self._create_solved_grid_wrapper(grid)
 
         try:
-            # 1. Check Basic Rules (Row, Col, Box/Region)
-            self._check_rows(solved_grid)
-            self._check_cols(solved_grid)
-            
-            # Check Boxes or Regions
-            if "jigsaw" in config.type.value.lower():
-                self._check_regions(solved_grid)
-            else:
-                self._check_boxes(solved_grid)
-            
-            # 2. Check Variant Constraints
-            # 2. Check Variant Constraints
+            # 1. Check every unit (Row, Col, Box/Region and Diagonal/Windoku/Asterisk)
+            # The topology is built from the config type, not from grid.constraints,
+            # so a grid missing its constraint objects still fails validation.
             type_val = config.type.value.lower()
+            self._check_units(solved_grid, self._build_topology(solved_grid, type_val))
             
-            if "diagonal" in type_val:
-                self._check_diagonal(solved_grid)
-                
-            if "windoku" in type_val:
-                self._check_windoku(solved_grid)
-                
-            if "asterisk" in type_val:
-                self._check_asterisk(solved_grid)
-                
+            # 2. Check Variant Constraints
             if "consecutive" in type_val:
                 self._check_consecutive(solved_grid, grid) # Pass original grid for constraints
                 
@@ -88,83 +74,28 @@ class SudokuValidator:
         if len(values) != len(set(values)):
             raise AssertionError(f"{context}: Duplicate values found {values}")
 
-    def _check_rows(self, grid):
-        for r in range(grid.size):
-            values = [grid.cells[r][c].value for c in range(grid.size)]
-            self._check_unique(values, f"Row {r}")
-
-    def _check_cols(self, grid):
-        for c in range(grid.size):
-            values = [grid.cells[r][c].value for r in range(grid.size)]
-            self._check_unique(values, f"Col {c}")
-
-    def _check_regions(self, grid):
-        # Group values by region_id
-        regions = {}
-        for r in range(grid.size):
-            for c in range(grid.size):
-                rid = grid.cells[r][c].region_id
-                if rid not in regions: regions[rid] = []
-                regions[rid].append(grid.cells[r][c].value)
-        
-        for rid, values in regions.items():
-            self._check_unique(values, f"Region {rid}")
-
-    def _check_boxes(self, grid):
-        # Determine box dimensions
-        if grid.size == 6: box_rows, box_cols = 2, 3
-        elif grid.size == 8: box_rows, box_cols = 2, 4
-        elif grid.size == 9: box_rows, box_cols = 3, 3
-        elif grid.size == 10: box_rows, box_cols = 2, 5
-        elif grid.size == 12: box_rows, box_cols = 3, 4
-        elif grid.size == 14: box_rows, box_cols = 2, 7
-        elif grid.size == 15: box_rows, box_cols = 3, 5
-        elif grid.size == 16: box_rows, box_cols = 4, 4
-        else:
-            # Try to find integer sqrt
-            root = int(grid.size ** 0.5)
-            if root * root == grid.size:
-                box_rows, box_cols = root, root
-            else:
-                # Fallback? Or assume no box constraint?
-                # For now, assume square if not listed
-                box_rows, box_cols = root, grid.size // root
-
-        for r in range(0, grid.size, box_rows):
-            for c in range(0, grid.size, box_cols):
-                values = []
-                for br in range(box_rows):
-                    for bc in range(box_cols):
-                        if r + br < grid.size and c + bc < grid.size:
-                            values.append(grid.cells[r + br][c + bc].value)
-                self._check_unique(values, f"Box ({r},{c})")
-
-    def _check_diagonal(self, grid):
-        # Main Diagonal
-        main = [grid.cells[i][i].value for i in range(grid.size)]
-        self._check_unique(main, "Main Diagonal")
+    def _build_topology(self, grid, type_val: str) -> SudokuTopology:
+        region_map = None
+        if "jigsaw" in type_val:
+            region_map = [[grid.cells[r][c].region_id for c in range(grid.size)] for r in range(grid.size)]
         
-        # Anti Diagonal
-        anti = [grid.cells[i][grid.size - 1 - i].value for i in range(grid.size)]
-        self._check_unique(anti, "Anti Diagonal")
-
-    def _check_windoku(self, grid):
-        windows = [(1, 1), (1, 5), (5, 1), (5, 5)]
-        for i, (sr, sc) in enumerate(windows):
-            values = []
-            for r in range(sr, sr + 3):
-                for c in range(sc, sc + 3):
-                    values.append(grid.cells[r][c].value)
-            self._check_unique(values, f"Window {i+1}")
-
-    def _check_asterisk(self, grid):
-        asterisk_cells = {
-            (1, 4), (2, 2), (2, 6),
-            (4, 1), (4, 4), (4, 7),
-            (6, 2), (6, 6), (7, 4)
-        }
-        values = [grid.cells[r][c].value for r, c in asterisk_cells]
-        self._check_unique(values, "Asterisk")
+        constraints = []
+        if "diagonal" in type_val:
+            constraints.append(DiagonalConstraint())
+        if "windoku" in type_val:
+            constraints.append(WindokuConstraint())
+        if "asterisk" in type_val:
+            constraints.append(AsteriskConstraint())
+            
+        return SudokuTopology.build(grid.size, region_map, constraints)
+
+    def _check_units(self, grid, topology: SudokuTopology):
+        kind_counts = {}
+        for unit, kind in zip(topology.units, topology.unit_kinds):
+            index = kind_counts.get(kind, 0)
+            kind_counts[kind] = index + 1
+            values = [grid.cells[idx // grid.size][idx % grid.size].value for idx in unit]
+            self._check_unique(values, f"{kind.title()} {index}")
 
     def _check_consecutive(self, solved_grid, original_grid):
         # 1. Verify marked pairs are actually consecutive
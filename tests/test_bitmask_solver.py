@@ -0,0 +1,197 @@
+import unittest
+import random
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.settings import GenerationConfig, SudokuType, Difficulty
+from app.models.grid import SudokuGrid
+from app.core.factory import PuzzleGenerator
+from app.core.solver import SudokuSolver
+from app.core.bitmask_solver import BitmaskSolver, SearchStatus
+
+class TestBitmaskSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = PuzzleGenerator()
+        self.legacy = SudokuSolver()
+        self.bitmask = BitmaskSolver()
+
+    def test_count_matches_legacy_for_all_types(self):
+        """Bitmask count_solutions must agree with the legacy solver on every type."""
+        for sudoku_type in SudokuType:
+            with self.subTest(type=sudoku_type.name):
+                grid = self.generator.generate(GenerationConfig(type=sudoku_type, difficulty=Difficulty.EASY))
+                before = str(grid)
+
+                self.assertEqual(self.bitmask.count_solutions(grid), self.legacy.count_solutions(grid.clone()))
+                self.assertEqual(str(grid), before, "count_solutions must leave the grid unchanged")
+
+                # Removing extra clues must give the same (non-unique) count too
+                loose = grid.clone()
+                for r in range(loose.size):
+                    loose.cells[r][0].value = 0
+                    loose.cells[r][1].value = 0
+                self.assertEqual(self.bitmask.count_solutions(loose, limit=5),
+                                 self.legacy.count_solutions(loose.clone(), limit=5))
+
+    def test_randomized_solve_matches_legacy(self):
+        """With the same seed both solvers must produce the same grid."""
+        for sudoku_type in (SudokuType.CLASSIC_9X9, SudokuType.DIAGONAL_6X6, SudokuType.JIGSAW_9X9):
+            with self.subTest(type=sudoku_type.name):
+                puzzle = self.generator.generate(GenerationConfig(type=sudoku_type, difficulty=Difficulty.EASY))
+                # Start from the full solution with two rows cleared (several solutions possible)
+                for r in range(puzzle.size):
+                    for c in range(puzzle.size):
+                        puzzle.cells[r][c].value = 0 if r < 2 else puzzle.solution[r][c]
+
+                legacy_grid, bitmask_grid = puzzle.clone(), puzzle.clone()
+                random.seed(1234)
+                legacy_ok = self.legacy.solve(legacy_grid, randomize=True)
+                random.seed(1234)
+                bitmask_ok = self.bitmask.solve(bitmask_grid, randomize=True)
+
+                self.assertEqual(legacy_ok, bitmask_ok)
+                self.assertEqual(str(legacy_grid), str(bitmask_grid))
+
+    def test_mrv_counts_match_first_empty_selection(self):
+        """MRV only changes the branching order, never the number of solutions."""
+        mrv = BitmaskSolver(cell_selection="mrv")
+        for sudoku_type in SudokuType:
+            with self.subTest(type=sudoku_type.name):
+                grid = self.generator.generate(GenerationConfig(type=sudoku_type, difficulty=Difficulty.HARD))
+                before = str(grid)
+                self.assertEqual(mrv.count_solutions(grid), self.bitmask.count_solutions(grid))
+                self.assertEqual(str(grid), before)
+
+                loose = grid.clone()
+                for c in range(loose.size):
+                    loose.cells[0][c].value = 0
+                    loose.cells[1][c].value = 0
+                self.assertEqual(mrv.count_solutions(loose, limit=5), self.bitmask.count_solutions(loose, limit=5))
+
+    def test_mrv_randomized_solve_is_valid(self):
+        mrv = BitmaskSolver(cell_selection="mrv")
+        for sudoku_type in (SudokuType.CLASSIC_6X6, SudokuType.CLASSIC_9X9, SudokuType.WINDOKU_9X9):
+            with self.subTest(type=sudoku_type.name):
+                config = GenerationConfig(type=sudoku_type)
+                grid = SudokuGrid(size=config.size)
+                grid.constraints = self.generator.generate(config).constraints
+
+                self.assertTrue(mrv.solve(grid, randomize=True))
+                self.assertTrue(grid.is_full())
+                for r in range(grid.size):
+                    for c in range(grid.size):
+                        value = grid.cells[r][c].value
+                        grid.cells[r][c].value = 0
+                        self.assertTrue(self.legacy.is_safe(grid, r, c, value))
+                        grid.cells[r][c].value = value
+
+    def test_propagation_counts_match(self):
+        """Propagation only fills forced cells, so counts must not change."""
+        solvers = [BitmaskSolver(cell_selection, propagation)
+                   for cell_selection in BitmaskSolver.CELL_SELECTIONS
+                   for propagation in ("singles", "locked")]
+        for sudoku_type in SudokuType:
+            with self.subTest(type=sudoku_type.name):
+                grid = self.generator.generate(GenerationConfig(type=sudoku_type, difficulty=Difficulty.HARD))
+                loose = grid.clone()
+                for c in range(loose.size):
+                    loose.cells[0][c].value = 0
+                    loose.cells[loose.size - 1][c].value = 0
+                expected = (self.bitmask.count_solutions(grid), self.bitmask.count_solutions(loose, limit=5))
+
+                before = (str(grid), str(loose))
+                for solver in solvers:
+                    self.assertEqual((solver.count_solutions(grid), solver.count_solutions(loose, limit=5)), expected)
+                self.assertEqual((str(grid), str(loose)), before)
+
+    def test_easy_puzzle_needs_no_branching(self):
+        solver = BitmaskSolver(cell_selection="mrv", propagation="singles")
+        puzzle = ["53..7....", "6..195...", ".98....6.", "8...6...3", "4..8.3..1",
+                  "7...2...6", ".6....28.", "...419..5", "....8..79"]
+        grid = SudokuGrid(size=9)
+        for r, line in enumerate(puzzle):
+            for c, char in enumerate(line):
+                grid.cells[r][c].value = 0 if char == "." else int(char)
+        empty = sum(line.count(".") for line in puzzle)
+
+        with self.assertLogs("MTSudoku", level="DEBUG") as logs:
+            self.assertEqual(solver.count_solutions(grid), 1)
+        self.assertEqual(solver.nodes_visited, 0)
+        self.assertEqual(solver.propagated_cells, empty)
+        self.assertIn("0 branch nodes", logs.output[-1])
+
+        expected = grid.clone()
+        self.assertTrue(self.legacy.solve(expected))
+        self.assertTrue(solver.solve(grid))
+        self.assertEqual(str(grid), str(expected))
+
+    def test_paused_search_resumes_to_same_result(self):
+        """Running a count in small node budgets must end exactly like one uninterrupted run."""
+        grid = self.generator.generate(GenerationConfig(type=SudokuType.DIAGONAL_9X9, difficulty=Difficulty.HARD))
+        for r in range(grid.size):
+            grid.cells[0][r].value = 0
+        before = str(grid)
+
+        expected = self.bitmask.count_solutions(grid, limit=5)
+        expected_nodes = self.bitmask.nodes_visited
+
+        solver = BitmaskSolver()
+        solver.start_count(grid, limit=5)
+        pauses = 0
+        while solver.resume(max_nodes=7) == SearchStatus.PAUSED:
+            self.assertTrue(solver.budget_exceeded)
+            pauses += 1
+
+        self.assertGreater(pauses, 0)
+        self.assertEqual(solver.status, SearchStatus.COUNTED)
+        self.assertEqual(solver.solution_count, expected)
+        self.assertEqual(solver.nodes_visited, expected_nodes)
+        self.assertEqual(str(grid), before)
+
+    def test_node_budget_abandons_search(self):
+        grid = SudokuGrid(size=9)
+        before = str(grid)
+
+        self.assertFalse(self.bitmask.solve(grid, max_nodes=10))
+        self.assertTrue(self.bitmask.budget_exceeded)
+        self.assertEqual(self.bitmask.status, SearchStatus.CANCELLED)
+        self.assertEqual(str(grid), before)
+
+        self.assertTrue(self.bitmask.solve(grid))
+        self.assertFalse(self.bitmask.budget_exceeded)
+        self.assertTrue(grid.is_full())
+
+    def test_16x16_solve_without_recursion(self):
+        grid = SudokuGrid(size=16)
+        solver = BitmaskSolver(cell_selection="mrv")
+        self.assertTrue(solver.solve(grid, randomize=True))
+        self.assertTrue(grid.is_full())
+        for r in range(16):
+            self.assertEqual(sorted(grid.get_row(r)), list(range(1, 17)))
+            self.assertEqual(sorted(grid.get_col(r)), list(range(1, 17)))
+
+    def test_unknown_cell_selection(self):
+        with self.assertRaises(ValueError):
+            BitmaskSolver(cell_selection="random")
+        with self.assertRaises(ValueError):
+            BitmaskSolver(propagation="x-wing")
+
+    def test_unsolvable_grid_is_left_untouched(self):
+        grid = SudokuGrid(size=9)
+        # (0, 0) has no candidate: 1-8 are in its row and 9 is in its column
+        for c in range(1, 9):
+            grid.cells[0][c].value = c
+        grid.cells[5][0].value = 9
+
+        before = str(grid)
+        for solver in (self.bitmask, BitmaskSolver(cell_selection="mrv"), BitmaskSolver(propagation="locked")):
+            self.assertFalse(solver.solve(grid))
+            self.assertEqual(str(grid), before)
+            self.assertEqual(solver.count_solutions(grid), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import pickle
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.settings import GenerationConfig, SudokuType, Difficulty
+from app.models.grid import SudokuGrid, CompactGrid
+from app.models.constraints import DiagonalConstraint
+from app.core.factory import PuzzleGenerator
+from app.core.topology import SudokuTopology
+from app.core.bitmask_solver import BitmaskSolver
+
+class TestCompactGrid(unittest.TestCase):
+
+    def test_cell_views_write_through(self):
+        grid = CompactGrid(size=6)
+        cell = grid.cells[1][2]
+        cell.value = 4
+        cell.is_fixed = True
+        cell.region_id = 3
+
+        self.assertEqual(grid.values[8], 4)
+        self.assertEqual(grid.get_row(1), [0, 0, 4, 0, 0, 0])
+        self.assertEqual(grid.get_col(2), [0, 4, 0, 0, 0, 0])
+        self.assertTrue(grid.fixed >> 8 & 1)
+        self.assertEqual(grid.region_map[8], 3)
+        self.assertEqual(grid.get_region_cells(3), [cell])
+        self.assertFalse(grid.is_full())
+
+        cell.is_fixed = False
+        self.assertEqual(grid.fixed, 0)
+
+    def test_clone_shares_immutable_parts(self):
+        grid = CompactGrid(size=9)
+        grid.apply_region_map([[r // 3 * 3 + c // 3 for c in range(9)] for r in range(9)])
+        grid.solution = [[(r * 3 + r // 3 + c) % 9 + 1 for c in range(9)] for r in range(9)]
+
+        clone = grid.clone()
+        clone.cells[0][0].value = 7
+        self.assertEqual(grid.cells[0][0].value, 0)
+        self.assertIs(clone.region_map, grid.region_map)
+        self.assertEqual(clone.solution, grid.solution)
+
+    def test_round_trip_and_pickle(self):
+        generator = PuzzleGenerator()
+        for sudoku_type in (SudokuType.JIGSAW_9X9, SudokuType.EVEN_ODD_9X9, SudokuType.CONSECUTIVE_9X9):
+            with self.subTest(type=sudoku_type.name):
+                grid = generator.generate(GenerationConfig(type=sudoku_type, difficulty=Difficulty.EASY))
+                self.assertIsInstance(grid, CompactGrid)
+
+                restored = pickle.loads(pickle.dumps(grid))
+                self.assertEqual(str(restored), str(grid))
+                self.assertEqual(restored.region_map, grid.region_map)
+                self.assertEqual(restored.fixed, grid.fixed)
+                self.assertEqual(restored.solution, grid.solution)
+                self.assertEqual(restored.even_odd_mask, grid.even_odd_mask)
+                self.assertEqual(restored.consecutive_pairs, grid.consecutive_pairs)
+
+                legacy = grid.to_grid()
+                self.assertIsInstance(legacy, SudokuGrid)
+                self.assertEqual(str(legacy), str(grid))
+                self.assertEqual(CompactGrid.from_grid(legacy).__getstate__(), grid.__getstate__())
+
+                self.assertLess(len(pickle.dumps(grid)), len(pickle.dumps(legacy)) // 3)
+
+    def test_solvers_and_topology_accept_compact_grid(self):
+        grid = SudokuGrid(size=9)
+        grid.type_name = "9x9 Jigsaw Sudoku"
+        grid.apply_region_map([[r for c in range(9)] for r in range(9)])  # one region per row
+        grid.constraints.append(DiagonalConstraint())
+        compact = CompactGrid.from_grid(grid)
+
+        self.assertIs(SudokuTopology.for_grid(compact), SudokuTopology.for_grid(grid))
+        self.assertTrue(BitmaskSolver().solve(compact))
+        self.assertTrue(compact.is_full())
+        self.assertEqual(BitmaskSolver().count_solutions(compact), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.settings import GenerationConfig, SudokuType, Difficulty
+from app.models.grid import SudokuGrid
+from app.core.factory import PuzzleGenerator
+from app.core.bitmask_solver import BitmaskSolver
+from app.core.dlx_solver import DancingLinksSolver
+from app.core.solver_registry import create_solver
+from app.core.topology import SudokuTopology
+
+class TestDancingLinksSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = PuzzleGenerator(solver_backend="dlx")
+        self.bitmask = BitmaskSolver()
+        self.dlx = DancingLinksSolver()
+
+    def assert_valid_solution(self, grid: SudokuGrid):
+        topology = SudokuTopology.for_grid(grid)
+        for unit in topology.units:
+            values = [grid.cells[idx // grid.size][idx % grid.size].value for idx in unit]
+            self.assertNotIn(0, values)
+            self.assertEqual(len(values), len(set(values)))
+
+    def test_count_matches_bitmask_for_all_types(self):
+        for sudoku_type in SudokuType:
+            with self.subTest(type=sudoku_type.name):
+                grid = self.generator.generate(GenerationConfig(type=sudoku_type, difficulty=Difficulty.HARD))
+                before = str(grid)
+                self.assertEqual(self.dlx.count_solutions(grid), self.bitmask.count_solutions(grid))
+                self.assertEqual(str(grid), before, "count_solutions must leave the grid unchanged")
+
+                loose = grid.clone()
+                for r in range(loose.size):
+                    loose.cells[r][r].value = 0
+                    loose.cells[r][loose.size - 1 - r].value = 0
+                self.assertEqual(self.dlx.count_solutions(loose, limit=10), self.bitmask.count_solutions(loose, limit=10))
+
+                solved = grid.clone()
+                self.assertTrue(self.dlx.solve(solved))
+                self.assertEqual([[c.value for c in row] for row in solved.cells], grid.solution)
+
+    def test_randomized_solve_from_empty(self):
+        for sudoku_type in (SudokuType.CLASSIC_9X9, SudokuType.DIAGONAL_6X6, SudokuType.WINDOKU_9X9):
+            with self.subTest(type=sudoku_type.name):
+                config = GenerationConfig(type=sudoku_type)
+                grid = self.generator.generate(config)
+                for row in grid.cells:
+                    for cell in row:
+                        cell.value = 0
+                self.assertTrue(self.dlx.solve(grid, randomize=True))
+                self.assert_valid_solution(grid)
+
+    def test_no_candidate_cell(self):
+        grid = SudokuGrid(size=9)
+        for c in range(1, 9):
+            grid.cells[0][c].value = c
+        grid.cells[5][0].value = 9
+        self.assertEqual(self.dlx.count_solutions(grid), 0)
+        self.assertFalse(self.dlx.solve(grid))
+
+    def test_backend_selection(self):
+        self.assertIsInstance(create_solver("dlx"), DancingLinksSolver)
+        self.assertIsInstance(create_solver("bitmask"), BitmaskSolver)
+        with self.assertRaises(ValueError):
+            create_solver("quantum")
+
+if __name__ == '__main__':
+    unittest.main()
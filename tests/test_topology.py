@@ -0,0 +1,72 @@
+import unittest
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.models.grid import SudokuGrid
+from app.models.constraints import ConstraintStrategy, DiagonalConstraint, WindokuConstraint, AsteriskConstraint
+from app.core.topology import SudokuTopology
+from app.core.solver import SudokuSolver
+from app.core.bitmask_solver import BitmaskSolver
+
+class NoCornerOneConstraint(ConstraintStrategy):
+    """Test constraint without a unit form: 1 is not allowed in the top-left cell."""
+    def is_valid(self, grid, row: int, col: int, num: int) -> bool:
+        return not (row == 0 and col == 0 and num == 1)
+
+class TestTopology(unittest.TestCase):
+
+    def setUp(self):
+        SudokuTopology.clear_cache()
+
+    def test_standard_units_and_peers(self):
+        topology = SudokuTopology.build(9)
+        self.assertEqual(len(topology.units), 27)
+        self.assertEqual(topology.unit_kinds.count('box'), 9)
+        self.assertTrue(all(len(peers) == 20 for peers in topology.peers))
+        self.assertEqual(len(topology.cell_units[40]), 3)
+
+        topology_6 = SudokuTopology.build(6)
+        # 2x3 boxes: top-left box spans rows 0-1 and cols 0-2
+        self.assertIn((0, 1, 2, 6, 7, 8), topology_6.units)
+
+    def test_constraint_units(self):
+        diagonal = SudokuTopology.build(9, constraints=[DiagonalConstraint()])
+        self.assertEqual(diagonal.unit_kinds.count('diagonal'), 2)
+        self.assertEqual(len(diagonal.peers[40]), 20 + 12)  # centre cell: 16 diagonal peers, 4 already in its box
+
+        windoku = SudokuTopology.build(9, constraints=[WindokuConstraint()])
+        self.assertEqual(len(windoku.cells_of_kind('window')), 36)
+
+        asterisk = SudokuTopology.build(9, constraints=[AsteriskConstraint()])
+        self.assertEqual(sorted(asterisk.cells_of_kind('asterisk')), sorted(AsteriskConstraint().asterisk_cells))
+        self.assertEqual(SudokuTopology.build(6, constraints=[AsteriskConstraint()]).cells_of_kind('asterisk'), [])
+
+    def test_jigsaw_regions_and_cache(self):
+        grid = SudokuGrid(size=6)
+        grid.type_name = "6x6 Jigsaw Sudoku"
+        region_map = [[(r * 6 + c) // 6 for c in range(6)] for r in range(6)]  # one region per row
+        grid.apply_region_map(region_map)
+
+        topology = SudokuTopology.for_grid(grid)
+        self.assertEqual(topology.unit_kinds.count('region'), 6)
+        self.assertIs(topology, SudokuTopology.for_grid(grid))
+
+        grid.apply_region_map([[c for c in range(6)] for _ in range(6)])  # one region per column
+        self.assertIsNot(topology, SudokuTopology.for_grid(grid))
+
+    def test_opaque_constraints_still_checked(self):
+        grid = SudokuGrid(size=6)
+        grid.constraints.append(NoCornerOneConstraint())
+        self.assertEqual(SudokuTopology.for_grid(grid).opaque_indices, (0,))
+
+        for solver in (SudokuSolver(), BitmaskSolver()):
+            candidate = grid.clone()
+            self.assertFalse(solver.is_safe(candidate, 0, 0, 1))
+            self.assertTrue(solver.solve(candidate))
+            self.assertNotEqual(candidate.cells[0][0].value, 1)
+
+if __name__ == '__main__':
+    unittest.main()